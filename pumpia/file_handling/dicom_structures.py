@@ -6,20 +6,163 @@ Classes:
  * Study
 """
 
+import bisect
 import datetime
-from copy import copy
+from operator import attrgetter
 from pathlib import Path
 from collections.abc import Callable, Sequence
 from typing import Any, Literal, overload
 import pydicom
+from pydicom.dataelem import RawDataElement
 from pydicom.errors import InvalidDicomError
+from pydicom.multival import MultiValue
 from pydicom import dcmread
-from pydicom.pixels.processing import convert_color_space
+from pydicom.pixels.utils import pixel_array
 import numpy as np
 
 from pumpia.file_handling.dicom_tags import _CoreTags, Tag, get_tag, get_value
 from pumpia.image_handling.image_structures import FileImageSet, ImageCollection
 
+_STUDY_SORT_KEY = attrgetter("study_datetime")
+_SORT_VALUE_KEY = attrgetter("sort_value")
+# number of decoded frames kept by each enhanced series
+_DECODED_FRAME_CACHE_SIZE = 4
+
+
+def _pixel_shape(open_dicom: pydicom.Dataset,
+                 num_samples: int
+                 ) -> tuple[int, int, int, int] | tuple[int, int, int]:
+    """
+    Returns the shape of the pixel data in a DICOM dataset from the image pixel tags,
+    so that the pixel data does not have to be read or decoded.
+
+    Parameters
+    ----------
+    open_dicom : pydicom.Dataset
+        The DICOM dataset.
+    num_samples : int
+        The number of samples per pixel.
+
+    Returns
+    -------
+    tuple[int, int, int, int] | tuple[int, int, int]
+        The shape in the format (frames, rows, columns[, samples]).
+    """
+    num_frames = int(open_dicom.get("NumberOfFrames", 1) or 1)
+    rows = int(open_dicom.Rows)
+    columns = int(open_dicom.Columns)
+    if num_samples > 1:
+        return (num_frames, rows, columns, num_samples)
+    return (num_frames, rows, columns)
+
+
+def _rescale_values(value: Any, default: float) -> float | list[float]:
+    """
+    Returns a rescale slope or intercept tag value as floats,
+    with empty or missing values replaced by `default`.
+
+    Parameters
+    ----------
+    value : Any
+        The tag value, or a list of the tag value of each slice.
+    default : float
+        The value to use where the tag value is None.
+
+    Returns
+    -------
+    float | list[float]
+        The rescale value, or the rescale value of each slice.
+    """
+    if isinstance(value, (list, tuple, MultiValue)):
+        return [default if v is None else float(v) for v in value]
+    return default if value is None else float(value)
+
+
+def _apply_rescale(array: np.ndarray,
+                   slope: float | Sequence[float],
+                   intercept: float | Sequence[float]
+                   ) -> np.ndarray:
+    """
+    Applies a rescale slope and intercept to a float array in place.
+
+    Parameters
+    ----------
+    array : np.ndarray
+        The float array in the format (slices, rows, columns[, samples]).
+    slope : float | Sequence[float]
+        The rescale slope, or the rescale slope of each slice.
+    intercept : float | Sequence[float]
+        The rescale intercept, or the rescale intercept of each slice.
+
+    Returns
+    -------
+    np.ndarray
+        The rescaled array.
+    """
+    # per slice values are broadcast along the first axis
+    slope_array = np.asarray(slope, dtype=float)
+    if slope_array.ndim > 0:
+        slope_array = slope_array.reshape(-1, *([1] * (array.ndim - 1)))
+    intercept_array = np.asarray(intercept, dtype=float)
+    if intercept_array.ndim > 0:
+        intercept_array = intercept_array.reshape(-1, *([1] * (array.ndim - 1)))
+
+    if np.any(slope_array != 1):
+        array *= slope_array
+    if np.any(intercept_array != 0):
+        array += intercept_array
+    return array
+
+
+def _native_frame_layout(open_dicom: pydicom.Dataset
+                         ) -> tuple[np.dtype, tuple[int, ...], int] | None:
+    """
+    Returns the layout of the frames in the pixel data of a DICOM file
+    if it is stored natively and has not been read from the file,
+    so that single frames can be read straight from disk when they are accessed.
+
+    Parameters
+    ----------
+    open_dicom : pydicom.Dataset
+        The DICOM dataset, read with a deferred pixel data element.
+
+    Returns
+    -------
+    tuple[np.dtype, tuple[int, ...], int] | None
+        The dtype, the frame shape in the format (rows, columns[, samples])
+        and the file offset of the first frame,
+        or None if the pixel data needs decoding or processing by pydicom.
+    """
+    try:
+        transfer_syntax = open_dicom.file_meta.TransferSyntaxUID
+        element = open_dicom.get_item(0x7FE00010, keep_deferred=True)
+        bits_allocated = int(open_dicom.BitsAllocated)
+        bits_stored = int(open_dicom.BitsStored)
+        pixel_representation = int(open_dicom.PixelRepresentation)
+        num_samples = int(open_dicom.SamplesPerPixel)
+        photo_interp = open_dicom.PhotometricInterpretation
+        planar_configuration = int(open_dicom.get("PlanarConfiguration", 0) or 0)
+    except (AttributeError, KeyError, TypeError, ValueError):
+        return None
+
+    if (not transfer_syntax.is_little_endian
+            or transfer_syntax.is_encapsulated
+            or transfer_syntax.is_deflated
+            or not isinstance(element, RawDataElement)
+            or element.value is not None
+            or bits_allocated not in (8, 16, 32)
+            or bits_stored != bits_allocated
+            or photo_interp not in ("MONOCHROME1", "MONOCHROME2", "RGB")
+            or planar_configuration != 0):
+        return None
+
+    dtype = np.dtype(("<i" if pixel_representation else "<u") + str(bits_allocated // 8))
+    shape = _pixel_shape(open_dicom, num_samples)
+    if element.length < np.prod(shape) * dtype.itemsize:
+        return None
+
+    return dtype, shape[1:], element.value_tell
+
 
 class Patient:
     """
@@ -45,15 +188,22 @@ class Patient:
     -------
     add_study(study: Study)
         Adds a study to the patient.
+    get_study(id_string: str) -> Study | None
+        Returns the study with the given ID string.
     """
 
+    __slots__ = ("patient_id", "name", "_studies", "_studies_sorted", "_id_string", "_hash")
+
     def __init__(self, patient_id: str, name: str) -> None:
         self.patient_id: str = str(patient_id)
         self.name: str = str(name)
-        self._studies: set[Study] = set()
+        self._id_string: str = "DICOM : " + self.patient_id
+        self._hash: int = hash(self._id_string)
+        self._studies: dict[str, Study] = {}
+        self._studies_sorted: list[Study] | None = None
 
     def __hash__(self) -> int:
-        return hash(self.id_string)
+        return self._hash
 
     def __eq__(self, value: object) -> bool:
         """
@@ -69,12 +219,14 @@ class Patient:
         bool
             True if equal, False otherwise.
         """
-        if isinstance(value, Patient):
+        if self is value:
+            return True
+        elif isinstance(value, Patient):
             return self.patient_id == value.patient_id
         elif isinstance(value, str):
-            return self.id_string == value
+            return self._id_string == value
         elif isinstance(value, int):
-            return hash(self) == value
+            return self._hash == value
         else:
             return False
 
@@ -91,12 +243,14 @@ class Patient:
     @property
     def id_string(self) -> str:
         """Returns the ID string of the patient. This is "DICOM : `patient_id`"."""
-        return "DICOM : " + self.patient_id
+        return self._id_string
 
     @property
     def studies(self) -> list['Study']:
         """Returns the list of studies for the patient."""
-        return sorted(self._studies, key=lambda x: x.study_datetime, reverse=True)
+        if self._studies_sorted is None:
+            self._studies_sorted = sorted(self._studies.values(), key=_STUDY_SORT_KEY, reverse=True)
+        return self._studies_sorted
 
     @property
     def tag(self) -> str:
@@ -117,7 +271,25 @@ class Patient:
         study : Study
             The study to add.
         """
-        self._studies.add(study)
+        if study.id_string not in self._studies:
+            self._studies[study.id_string] = study
+            self._studies_sorted = None
+
+    def get_study(self, id_string: str) -> 'Study | None':
+        """
+        Returns the study with the given ID string.
+
+        Parameters
+        ----------
+        id_string : str
+            The ID string of the study.
+
+        Returns
+        -------
+        Study | None
+            The study, or None if the patient does not have a study with the ID string.
+        """
+        return self._studies.get(id_string)
 
 
 class Study:
@@ -154,8 +326,13 @@ class Study:
     -------
     add_series(series: Series)
         Adds a series to the study.
+    get_series(id_string: str) -> Series | None
+        Returns the series with the given ID string.
     """
 
+    __slots__ = ("patient", "study_id", "study_datetime", "study_description",
+                 "_series", "_series_by_id", "_id_string", "_hash")
+
     def __init__(self,
                  patient: Patient,
                  study_id: str,
@@ -165,10 +342,13 @@ class Study:
         self.study_id: str = study_id
         self.study_datetime: datetime.datetime = study_datetime
         self.study_description: str = study_desc
-        self._series: set[Series] = set()
+        self._id_string: str = patient.id_string + " : " + study_id
+        self._hash: int = hash(self._id_string)
+        self._series: list[Series] = []
+        self._series_by_id: dict[str, Series] = {}
 
     def __hash__(self) -> int:
-        return hash(self.id_string)
+        return self._hash
 
     def __eq__(self, value: object) -> bool:
         """
@@ -184,12 +364,14 @@ class Study:
         bool
             True if equal, False otherwise.
         """
-        if isinstance(value, Study):
+        if self is value:
+            return True
+        elif isinstance(value, Study):
             return self.study_id == value.study_id
         elif isinstance(value, str):
-            return self.id_string == value
+            return self._id_string == value
         elif isinstance(value, int):
-            return hash(self) == value
+            return self._hash == value
         else:
             return False
 
@@ -205,12 +387,12 @@ class Study:
     @property
     def id_string(self) -> str:
         """Returns the ID string of the study."""
-        return self.patient.id_string + " : " + self.study_id
+        return self._id_string
 
     @property
     def series(self) -> list['Series']:
         """Returns the list of series for the study."""
-        return sorted(self._series, key=lambda x: x.sort_value)
+        return self._series
 
     @property
     def tag(self) -> str:
@@ -231,7 +413,25 @@ class Study:
         series : Series
             The series to add.
         """
-        self._series.add(series)
+        if series.id_string not in self._series_by_id:
+            self._series_by_id[series.id_string] = series
+            bisect.insort(self._series, series, key=_SORT_VALUE_KEY)
+
+    def get_series(self, id_string: str) -> 'Series | None':
+        """
+        Returns the series with the given ID string.
+
+        Parameters
+        ----------
+        id_string : str
+            The ID string of the series.
+
+        Returns
+        -------
+        Series | None
+            The series, or None if the study does not have a series with the ID string.
+        """
+        return self._series_by_id.get(id_string)
 
 
 class Series(ImageCollection):
@@ -258,6 +458,8 @@ class Series(ImageCollection):
         Whether the series is from an enhanced dicom file (default is False).
     open_dicom : pydicom.Dataset, optional
         The open DICOM dataset (default is None).
+        If not provided the file is read with large elements, such as the pixel data,
+        deferred until they are accessed.
     filepath : Path, optional
         The file path of the series (default is None).
 
@@ -288,12 +490,22 @@ class Series(ImageCollection):
     -------
     add_instance(instance: 'Instance')
         Adds an instance to the series.
+    get_frame(frame_number: int) -> np.ndarray
+        Returns the raw array of a single frame of an enhanced series.
+    get_instance(id_string: str) -> Instance | None
+        Returns the instance with the given ID string.
     get_tag(tag: Tag, instance_number: int)
         Gets the tag for a specific instance in the series.
     get_value(tag: Tag, instance_number: int)
         Gets the value of a tag for a specific instance in the series.
     """
 
+    __slots__ = ("study", "series_id", "series_number", "acquisition_number",
+                 "series_description", "is_enhanced", "instance_number",
+                 "_filepath", "_dicom", "_frame_layout", "_decoded_frames", "_tag_cache",
+                 "_instances_by_id",
+                 "_id_string", "_hash")
+
     def __init__(self,
                  study: Study,
                  series_id: str,
@@ -318,7 +530,18 @@ class Series(ImageCollection):
         else:
             self.instance_number = None
 
-        self._filepath: Path | None = copy(filepath)
+        if self.is_enhanced:
+            self._id_string: str = (study.id_string
+                                    + " : " + series_id
+                                    + "-" + str(acquisition_number)
+                                    + "-" + str(instance_number))
+        else:
+            self._id_string = (study.id_string
+                               + " : " + series_id
+                               + "-" + str(acquisition_number))
+        self._hash: int = hash(self._id_string)
+
+        self._filepath: Path | None = filepath
 
         if self.is_enhanced:
             if self._filepath is None:
@@ -326,7 +549,7 @@ class Series(ImageCollection):
                     "a valid filepath must be provided for an enhanced dicom file")
             if open_dicom is None:
                 try:
-                    open_dicom = dcmread(self._filepath)
+                    open_dicom = dcmread(self._filepath, defer_size="1 KB")
                 except InvalidDicomError as exc:
                     raise InvalidDicomError(
                         "filepath must be a valid DICOM file") from exc
@@ -335,26 +558,31 @@ class Series(ImageCollection):
                 photo_interp = get_value(open_dicom, _CoreTags.PhotometricInterpretation, get_first=True)
             except KeyError:
                 photo_interp = None
-            if num_samples == 1:
-                super().__init__(open_dicom.pixel_array.shape)
-            elif isinstance(photo_interp, str):
-                super().__init__(open_dicom.pixel_array.shape, num_samples, "RGB")
-            else:
-                super().__init__(open_dicom.pixel_array.shape, num_samples)
+            mode = "RGB" if num_samples > 1 and isinstance(photo_interp, str) else None
+            super().__init__(_pixel_shape(open_dicom, num_samples), num_samples, mode)
 
         else:
             super().__init__((0, 0, 0))
 
         self._dicom: pydicom.Dataset | None = open_dicom
-        self._image_set: set[Instance] = set()
+        self._tag_cache: dict[tuple[int, bool],
+                              pydicom.DataElement | list[pydicom.DataElement] | None] = {}
+        self._frame_layout: tuple[np.dtype, tuple[int, ...], int] | None = None
+        if self.is_enhanced and open_dicom is not None:
+            self._frame_layout = _native_frame_layout(open_dicom)
+        self._decoded_frames: dict[int, np.ndarray] = {}
+        self._image_set: list[Instance] = []
+        self._instances_by_id: dict[str, Instance] = {}
 
     def __eq__(self, value: object) -> bool:
-        if isinstance(value, Series):
-            return hash(self) == hash(value)
-        elif isinstance(value, int):
-            return hash(self) == value
+        if self is value:
+            return True
+        elif isinstance(value, Series):
+            return self._hash == value._hash
         elif isinstance(value, str):
-            return self.id_string == value
+            return self._id_string == value
+        elif isinstance(value, int):
+            return self._hash == value
         else:
             return False
 
@@ -369,9 +597,7 @@ class Series(ImageCollection):
                 + ":" + str(self.series_description))
 
     def __hash__(self) -> int:
-        # from docs: A class that overrides __eq__() and does not define __hash__()
-        # will have its __hash__() implicitly set to None.
-        return super().__hash__()
+        return self._hash
 
     @property
     def patient(self) -> Patient:
@@ -385,15 +611,7 @@ class Series(ImageCollection):
 
     @property
     def id_string(self) -> str:
-        if self.is_enhanced:
-            return (self.study.id_string
-                    + " : " + self.series_id
-                    + "-" + str(self.acquisition_number)
-                    + "-" + str(self.instance_number))
-        else:
-            return (self.study.id_string
-                    + " : " + self.series_id
-                    + "-" + str(self.acquisition_number))
+        return self._id_string
 
     @property
     def tag(self) -> str:
@@ -431,7 +649,7 @@ class Series(ImageCollection):
     @property
     def instances(self) -> list['Instance']:
         """Returns the list of instances for the series."""
-        return sorted(self._image_set, key=lambda x: x.sort_value)
+        return self._image_set
 
     @property
     def image_set(self) -> list['Instance']:
@@ -444,7 +662,9 @@ class Series(ImageCollection):
                                   | tuple[int, int, int],
                                   np.dtype]:
         """Returns the raw array of the series as stored in the dicom file.
-        This is usually an unsigned dtype so users should be careful when processing."""
+        This is usually an unsigned dtype so users should be careful when processing.
+        For enhanced series this is a view of the pixel data held for the dicom file,
+        so it must be copied before being modified."""
         if self.is_enhanced:
             if self._dicom is not None:
                 array = self._dicom.pixel_array
@@ -461,7 +681,76 @@ class Series(ImageCollection):
             else:
                 return np.array([[[0]]], dtype=np.uint8)
         else:
-            return np.concatenate([a.raw_array for a in self.instances], axis=0)
+            instance_arrays = [a.raw_array for a in self.instances]
+            array = np.empty((len(instance_arrays), *instance_arrays[0].shape[1:]),
+                             dtype=np.result_type(*instance_arrays))
+            for i, instance_array in enumerate(instance_arrays):
+                array[i] = instance_array[0]
+            return array  # pyright: ignore[reportReturnType]
+
+    def get_frame(self, frame_number: int) -> np.ndarray[tuple[int, int, Literal[3]]
+                                                         | tuple[int, int],
+                                                         np.dtype]:
+        """
+        Returns the raw array of a single frame of an enhanced series as stored in the dicom file.
+        Only the requested frame is read from the file or decoded from the pixel data.
+        The most recently decoded frames are kept, so this may return the same array
+        for repeated calls and it must be copied before being modified.
+
+        Parameters
+        ----------
+        frame_number : int
+            The frame number (starting at 1).
+
+        Raises
+        ------
+        ValueError
+            If the series is not from an enhanced dicom file.
+        """
+        if not self.is_enhanced:
+            raise ValueError("frames can only be read from an enhanced dicom series")
+        if self._dicom is None:
+            return np.array([[0]], dtype=np.uint8)
+        if self._frame_layout is not None and self._filepath is not None:
+            dtype, frame_shape, offset = self._frame_layout
+            frame_size = int(np.prod(frame_shape))
+            offset += (frame_number - 1) * frame_size * dtype.itemsize
+            try:
+                frame = np.fromfile(self._filepath, dtype=dtype, count=frame_size, offset=offset)
+            except OSError:
+                pass
+            else:
+                if frame.size == frame_size:
+                    return frame.reshape(frame_shape)  # pyright: ignore[reportReturnType]
+
+        # least recently used frames are dropped so decoded frames stay bounded
+        decoded_frame = self._decoded_frames.pop(frame_number, None)
+        if decoded_frame is None:
+            decoded_frame = pixel_array(self._dicom, index=frame_number - 1)
+            if len(self._decoded_frames) >= _DECODED_FRAME_CACHE_SIZE:
+                del self._decoded_frames[next(iter(self._decoded_frames))]
+        self._decoded_frames[frame_number] = decoded_frame
+        return decoded_frame
+
+    def _rescale_frames(self,
+                        raw_array: np.ndarray,
+                        frame_key: int | slice) -> np.ndarray:
+        """Applies the slope and intercept tags of the frames selected by `frame_key`
+        to the float array `raw_array` in place.
+        `raw_array` is returned unchanged if there are no slope and intercept tags."""
+        try:
+            slope = self.get_value(_CoreTags.RescaleSlope, "All")
+            intercept = self.get_value(_CoreTags.RescaleIntercept, "All")
+        except KeyError:
+            return raw_array
+
+        if isinstance(slope, list):
+            slope = slope[0] if len(slope) == 1 else slope[frame_key]
+        if isinstance(intercept, list):
+            intercept = intercept[0] if len(intercept) == 1 else intercept[frame_key]
+        return _apply_rescale(raw_array,
+                              _rescale_values(slope, 1),
+                              _rescale_values(intercept, 0))
 
     @overload
     def slice_array(self,
@@ -499,7 +788,7 @@ class Series(ImageCollection):
                     | tuple[slice | int, slice | int, slice | int]
                     ) -> np.ndarray[tuple[int, int, int, Literal[3]] | tuple[int, int, int] | tuple[int, int] | tuple[int], np.dtype] | np.dtype:
         """Returns a slice of the array with corrections defined by the slope and intercept tags.
-        If there are no slope and intercept tags then this is equivelant to `raw_array` as a float type.
+        If there are no slope and intercept tags then this is equivelant to `raw_array` as a float32 type.
         key in format (slice, y-position, x-position[, multisample/RGB values])
         """
         if self.is_enhanced:
@@ -536,116 +825,25 @@ class Series(ImageCollection):
                     stop = key.stop - key.start
                 final_key = slice(0, stop, key.step)
 
-            raw_array = self.raw_array[key].astype(float)
-
-            if not self.is_colour:
-                try:
-                    slope = self.get_value(_CoreTags.RescaleSlope, "All")
-                    intercept = self.get_value(_CoreTags.RescaleIntercept, "All")
-                    if isinstance(orig_key, (int, slice)):
-                        si_key = orig_key
-                    else:
-                        si_key = orig_key[0]
-
-                    if isinstance(slope, list):
-                        if len(slope) == 1:
-                            slope = slope[0]
-                        else:
-                            slope = slope[si_key]
-                    slope = np.array(slope)
-                    if len(slope.shape) == 0:
-                        raw_array = raw_array * slope
-                    else:
-                        raw_array = np.array([a * s for a, s in zip(raw_array, slope)])
+            raw_array = self.raw_array[key].astype(np.float32)
 
-                    if isinstance(intercept, list):
-                        if len(intercept) == 1:
-                            intercept = intercept[0]
-                        else:
-                            intercept = intercept[si_key]
-                    intercept = np.array(intercept)
-                    if len(intercept.shape) == 0:
-                        array = raw_array + intercept
-                    else:
-                        array = np.array([a + i for a, i in zip(raw_array, intercept)])
+            if isinstance(orig_key, (int, slice)):
+                frame_key = orig_key
+            else:
+                frame_key = orig_key[0]
 
-                except KeyError:
-                    array = raw_array
+            if not self.is_colour:
+                array = self._rescale_frames(raw_array, frame_key)
             else:
                 try:
                     photo_interp = self.get_value(_CoreTags.PhotometricInterpretation)
-                    if isinstance(photo_interp, str):
-                        if photo_interp != "RGB":
-                            array = convert_color_space(self.raw_array,
-                                                        photo_interp,
-                                                        'RGB')
-                        else:
-                            array = raw_array
-                    else:
-                        try:
-                            slope = self.get_value(_CoreTags.RescaleSlope, "All")
-                            intercept = self.get_value(_CoreTags.RescaleIntercept, "All")
-                            if isinstance(orig_key, (int, slice)):
-                                si_key = orig_key
-                            else:
-                                si_key = orig_key[0]
-
-                            if isinstance(slope, list):
-                                if len(slope) == 1:
-                                    slope = slope[0]
-                                else:
-                                    slope = slope[si_key]
-                            slope = np.array(slope)
-                            if len(slope.shape) == 0:
-                                raw_array = raw_array * slope
-                            else:
-                                raw_array = np.array([a * s for a, s in zip(raw_array, slope)])
-
-                            if isinstance(intercept, list):
-                                if len(intercept) == 1:
-                                    intercept = intercept[0]
-                                else:
-                                    intercept = intercept[si_key]
-                            intercept = np.array(intercept)
-                            if len(intercept.shape) == 0:
-                                array = raw_array + intercept
-                            else:
-                                array = np.array([a + i for a, i in zip(raw_array, intercept)])
-
-                        except KeyError:
-                            array = raw_array
-                except (KeyError, NotImplementedError):
-                    try:
-                        slope = self.get_value(_CoreTags.RescaleSlope, "All")
-                        intercept = self.get_value(_CoreTags.RescaleIntercept, "All")
-                        if isinstance(orig_key, (int, slice)):
-                            si_key = orig_key
-                        else:
-                            si_key = orig_key[0]
-
-                        if isinstance(slope, list):
-                            if len(slope) == 1:
-                                slope = slope[0]
-                            else:
-                                slope = slope[si_key]
-                        slope = np.array(slope)
-                        if len(slope.shape) == 0:
-                            raw_array = raw_array * slope
-                        else:
-                            raw_array = np.array([a * s for a, s in zip(raw_array, slope)])
-
-                        if isinstance(intercept, list):
-                            if len(intercept) == 1:
-                                intercept = intercept[0]
-                            else:
-                                intercept = intercept[si_key]
-                        intercept = np.array(intercept)
-                        if len(intercept.shape) == 0:
-                            array = raw_array + intercept
-                        else:
-                            array = np.array([a + i for a, i in zip(raw_array, intercept)])
-                    except KeyError:
-                        array = raw_array
+                except KeyError:
+                    photo_interp = None
+                if isinstance(photo_interp, str):
+                    # pydicom converts YCbCr pixel data to RGB as it is decoded
+                    array = raw_array
+                else:
+                    array = self._rescale_frames(raw_array, frame_key)
 
             if (final_key == slice(None, None, None)
                 or (isinstance(final_key, tuple)
@@ -684,24 +882,31 @@ class Series(ImageCollection):
     def current_slice_array(self) -> np.ndarray[tuple[int, int, int] | tuple[int, int], np.dtype]:
         return self.instances[self.current_slice].current_slice_array
 
+    def _window_center_width(self) -> tuple[Any | None, Any | None]:
+        """Returns the window center and window width tag values of the current instance,
+        None is returned for a tag if it cannot be found."""
+        try:
+            window_center = self.get_value(_CoreTags.WindowCenter, get_first=True)
+        except KeyError:
+            window_center = None
+        try:
+            window_width = self.get_value(_CoreTags.WindowWidth, get_first=True)
+        except KeyError:
+            window_width = None
+        return window_center, window_width
+
     @property
     def vmax(self) -> float | None:
         """Returns the default maximum value for the viewing LUT (i.e. white on a grey scale image).
         Calculated from the the window center and width tags.
         This is **not** normally the maximum value in the image,
         however if the relevant tags are not available then this is the fallback."""
-        try:
-            window_width = self.get_value(_CoreTags.WindowWidth, get_first=True)
-            window_center = self.get_value(_CoreTags.WindowCenter, get_first=True)
-            if window_center is not None and window_width is not None:
-                vmax = window_center + (window_width / 2)
-            else:
-                raise TypeError("Could not get window width or window center.")
-        except TypeError:
-            vmax = super().vmax
-        except KeyError:
-            vmax = super().vmax
-        return vmax
+        window_center, window_width = self._window_center_width()
+        # multi-valued or missing tags fall back to the image values
+        if (not isinstance(window_center, (int, float))
+                or not isinstance(window_width, (int, float))):
+            return super().vmax
+        return window_center + (window_width / 2)
 
     @property
     def vmin(self) -> float | None:
@@ -709,44 +914,36 @@ class Series(ImageCollection):
         Calculated from the the window center and width tags.
         This is **not** normally the minimum value in the image,
         however if the relevant tags are not available then this is the fallback."""
-        try:
-            window_width = self.get_value(_CoreTags.WindowWidth, get_first=True)
-            window_center = self.get_value(_CoreTags.WindowCenter, get_first=True)
-            if window_center is not None and window_width is not None:
-                vmin = window_center - (window_width / 2)
-            else:
-                raise TypeError("Could not get window width or window center.")
-        except TypeError:
-            vmin = super().vmin
-        except KeyError:
-            vmin = super().vmin
-        return vmin
+        window_center, window_width = self._window_center_width()
+        # multi-valued or missing tags fall back to the image values
+        if (not isinstance(window_center, (int, float))
+                or not isinstance(window_width, (int, float))):
+            return super().vmin
+        return window_center - (window_width / 2)
 
     @property
     def window(self) -> float | None:
         """Returns the default window width from the window width tag.
         If this is not available then it is calculated from the array min and max values."""
         try:
-            window = self.get_value(_CoreTags.WindowWidth, get_first=True)
-            if window is not None:
-                return window
-            else:
-                return super().window
-        except (KeyError, IndexError, TypeError):
+            _, window = self._window_center_width()
+        except (IndexError, TypeError):
             return super().window
+        if window is not None:
+            return window
+        return super().window
 
     @property
     def level(self) -> float | None:
         """Returns the default level (window centre) from the window center tag.
         If this is not available then it is calculated from the array min and max values."""
         try:
-            level = self.get_value(_CoreTags.WindowCenter, get_first=True)
-            if level is not None:
-                return level
-            else:
-                return super().level
-        except (KeyError, IndexError):
+            level, _ = self._window_center_width()
+        except IndexError:
             return super().level
+        if level is not None:
+            return level
+        return super().level
 
     @property
     def pixel_spacing(self) -> tuple[float, float] | None:
@@ -754,36 +951,14 @@ class Series(ImageCollection):
         Returns None if this cannot be found using the Pixel Spacing tag.
         (row_spacing, column_spacing)
         """
-        try:
-            pixel_spacing = self.get_value(_CoreTags.PixelSpacing, get_first=True)
-        except KeyError:
-            return None
-
-        if pixel_spacing is None:
-            return None
-
-        try:
-            row_spacing = pixel_spacing[0]
-            column_spacing = pixel_spacing[1]
-        except TypeError:
-            return None
-
-        return (row_spacing, column_spacing)
+        return self.current_image.pixel_spacing
 
     @property
     def slice_thickness(self) -> float | None:
         """Returns the slice thickness of the current instance in mm.
         Returns None if this cannot be found using the SliceThickness tag.
         """
-        try:
-            slice_thickness = self.get_value(_CoreTags.SliceThickness, get_first=True)
-        except KeyError:
-            return None
-
-        if slice_thickness is None:
-            return None
-
-        return slice_thickness
+        return self.current_image.slice_thickness
 
     @property
     def dicom_dataset(self) -> pydicom.Dataset | None:
@@ -809,7 +984,10 @@ class Series(ImageCollection):
                 and self.shape[2] == instance.shape[2]
                 and self.num_samples == instance.num_samples
                 and self.mode == instance.mode)):
-            self._image_set.add(instance)  # this line is different to parent
+            # kept sorted on insertion, this is different to parent
+            if instance.id_string not in self._instances_by_id:
+                self._instances_by_id[instance.id_string] = instance
+                bisect.insort(self._image_set, instance, key=_SORT_VALUE_KEY)
             self.shape = (len(self._image_set),
                           instance.shape[1],
                           instance.shape[2])
@@ -818,6 +996,22 @@ class Series(ImageCollection):
         else:
             raise ValueError("Instance incompatible with Series")
 
+    def get_instance(self, id_string: str) -> 'Instance | None':
+        """
+        Returns the instance with the given ID string.
+
+        Parameters
+        ----------
+        id_string : str
+            The ID string of the instance.
+
+        Returns
+        -------
+        Instance | None
+            The instance, or None if the series does not have an instance with the ID string.
+        """
+        return self._instances_by_id.get(id_string)
+
     def add_image(self, image: 'Instance'):
         if isinstance(image, Instance):
             self.add_instance(image)
@@ -892,11 +1086,23 @@ class Series(ImageCollection):
             instance_number = self.current_instance_number
         elif instance_number == "All":
             if self.is_enhanced:
-                dataset = self.dicom_dataset
-                if dataset is not None:
-                    return get_value(dataset, tag, None, get_first)
-                else:
-                    raise AttributeError("Series has no dicom_dataset loaded.")
+                # the frame sequences are only searched once per tag
+                cache_key = (int(tag), get_first)
+                if cache_key not in self._tag_cache:
+                    dataset = self.dicom_dataset
+                    if dataset is None:
+                        raise AttributeError("Series has no dicom_dataset loaded.")
+                    try:
+                        self._tag_cache[cache_key] = get_tag(dataset, tag, None, get_first)
+                    except KeyError:
+                        self._tag_cache[cache_key] = None
+
+                tag_object = self._tag_cache[cache_key]
+                if tag_object is None:
+                    raise KeyError(f"{tag}, {tag.name}")
+                if isinstance(tag_object, list):
+                    return [t.value for t in tag_object]
+                return tag_object.value
             else:
                 return [i.get_value(tag, get_first) for i in self.instances]
         if 0 < instance_number and instance_number <= self.num_slices:
@@ -925,6 +1131,10 @@ class Instance(FileImageSet):
         Whether the instance is a frame (default is False).
     dimension_index_values : list or tuple, optional
         The dimension index values of the instance (default is None).
+    open_dicom : pydicom.Dataset, optional
+        The open DICOM dataset (default is None).
+        If not provided the file is read with large elements, such as the pixel data,
+        deferred until they are accessed.
 
     Attributes
     ----------
@@ -949,6 +1159,9 @@ class Instance(FileImageSet):
         Gets the value of a tag for the instance.
     """
 
+    __slots__ = ("series", "is_frame", "slice_number", "dimension_index_values",
+                 "loaded", "_dicom", "_tag_cache", "_id_string", "_hash")
+
     def __init__(self,
                  series: Series,
                  slice_number: int,
@@ -967,6 +1180,9 @@ class Instance(FileImageSet):
         else:
             self.dimension_index_values = dimension_index_values
 
+        self._id_string: str = series.id_string + " : " + str(self)
+        self._hash: int = hash(self._id_string)
+
         self.loaded: bool = False
 
         if self.is_frame:
@@ -983,7 +1199,7 @@ class Instance(FileImageSet):
                 raise FileNotFoundError("A valid filepath must be provided")
             if open_dicom is None:
                 try:
-                    open_dicom = dcmread(filepath)
+                    open_dicom = dcmread(filepath, defer_size="1 KB")
                 except InvalidDicomError as exc:
                     raise InvalidDicomError(
                         "filepath must be a valid DICOM file") from exc
@@ -992,22 +1208,22 @@ class Instance(FileImageSet):
                 photo_interp = get_value(open_dicom, _CoreTags.PhotometricInterpretation, get_first=True)
             except KeyError:
                 photo_interp = None
-            if num_samples == 1:
-                super().__init__(open_dicom.pixel_array.shape, filepath)
-            elif isinstance(photo_interp, str):
-                super().__init__(open_dicom.pixel_array.shape, filepath, num_samples, "RGB")
-            else:
-                super().__init__(open_dicom.pixel_array.shape, filepath, num_samples)
+            mode = "RGB" if num_samples > 1 and isinstance(photo_interp, str) else None
+            super().__init__(_pixel_shape(open_dicom, num_samples), filepath, num_samples, mode)
 
         self._dicom: pydicom.Dataset | None = open_dicom
+        self._tag_cache: dict[tuple[int, bool],
+                              pydicom.DataElement | list[pydicom.DataElement] | None] = {}
 
     def __eq__(self, value: object) -> bool:
-        if isinstance(value, Instance):
-            return hash(self) == hash(value)
-        elif isinstance(value, int):
-            return hash(self) == value
+        if self is value:
+            return True
+        elif isinstance(value, Instance):
+            return self._hash == value._hash
         elif isinstance(value, str):
-            return self.id_string == value
+            return self._id_string == value
+        elif isinstance(value, int):
+            return self._hash == value
         else:
             return False
 
@@ -1017,9 +1233,7 @@ class Instance(FileImageSet):
         return str(self.dimension_index_values)
 
     def __hash__(self) -> int:
-        # from docs: A class that overrides __eq__() and does not define __hash__()
-        # will have its __hash__() implicitly set to None.
-        return super().__hash__()
+        return self._hash
 
     @property
     def study(self) -> Study:
@@ -1038,7 +1252,7 @@ class Instance(FileImageSet):
 
     @property
     def id_string(self) -> str:
-        return self.series.id_string + " : " + str(self)
+        return self._id_string
 
     @property
     def tag(self) -> str:
@@ -1058,9 +1272,13 @@ class Instance(FileImageSet):
                                   np.dtype]:
         """Returns the raw array of the instance as stored in the dicom file.
         This is usually an unsigned dtype so users should be careful when processing.
+        This may be a view of the pixel data held for the dicom file rather than a copy,
+        so it must be copied before being modified.
         Accessed through (0, y-position, x-position[, multisample/RGB values])"""
         if self.is_frame:
-            return self.series.raw_array[self.slice_number - 1:self.slice_number]
+            # only this frame is read, rather than the whole pixel data of the series.
+            # it is not cached so frames are not held alongside the series pixel data
+            return self.series.get_frame(self.slice_number)[np.newaxis, ...]
         elif self._dicom is not None:
             return self._dicom.pixel_array[np.newaxis, ...]
         else:
@@ -1102,7 +1320,7 @@ class Instance(FileImageSet):
                     | tuple[slice | int, slice | int, slice | int]
                     ) -> np.ndarray[tuple[Literal[1], int, int, Literal[3]] | tuple[int, int, int] | tuple[int, int] | tuple[int], np.dtype] | np.dtype:
         """Returns a slice of the array with corrections defined by the slope and intercept tags.
-        If there are no slope and intercept tags then this is equivelant to `raw_array` as a float type.
+        If there are no slope and intercept tags then this is equivelant to `raw_array` as a float32 type.
         key in format (0, y-position, x-position[, multisample/RGB values])
         """
 
@@ -1138,39 +1356,28 @@ class Instance(FileImageSet):
                 stop = key.stop - key.start
             final_key = slice(0, stop, key.step)
 
-        raw_array = self.raw_array[key].astype(float)
+        raw_array = self.raw_array[key].astype(np.float32)
 
-        if not self.is_colour:
+        photo_interp = None
+        if self.is_colour:
+            try:
+                photo_interp = self.get_value(_CoreTags.PhotometricInterpretation, get_first=True)
+            except KeyError:
+                pass
+
+        if isinstance(photo_interp, str):
+            # pydicom converts YCbCr pixel data to RGB as it is decoded
+            array = raw_array
+        else:
             try:
                 slope = self.get_value(_CoreTags.RescaleSlope, get_first=True)
                 intercept = self.get_value(_CoreTags.RescaleIntercept, get_first=True)
-                array = raw_array * slope + intercept
             except KeyError:
                 array = raw_array
-        else:
-            try:
-                photo_interp = self.get_value(_CoreTags.PhotometricInterpretation, get_first=True)
-                if isinstance(photo_interp, str):
-                    if photo_interp != "RGB":
-                        array = convert_color_space(self.raw_array,
-                                                    photo_interp,
-                                                    'RGB')
-                    else:
-                        array = raw_array
-                else:
-                    try:
-                        slope = self.get_value(_CoreTags.RescaleSlope, get_first=True)
-                        intercept = self.get_value(_CoreTags.RescaleIntercept, get_first=True)
-                        array = raw_array * slope + intercept
-                    except KeyError:
-                        array = raw_array
-            except (KeyError, NotImplementedError):
-                try:
-                    slope = self.get_value(_CoreTags.RescaleSlope, get_first=True)
-                    intercept = self.get_value(_CoreTags.RescaleIntercept, get_first=True)
-                    array = raw_array * slope + intercept
-                except KeyError:
-                    array = raw_array
+            else:
+                array = _apply_rescale(raw_array,
+                                       _rescale_values(slope, 1),
+                                       _rescale_values(intercept, 0))
 
         if (final_key == slice(None, None, None)
             or (isinstance(final_key, tuple)
@@ -1189,24 +1396,31 @@ class Instance(FileImageSet):
         """
         return self.slice_array(slice(None))
 
+    def _window_center_width(self) -> tuple[Any | None, Any | None]:
+        """Returns the window center and window width tag values,
+        None is returned for a tag if it cannot be found."""
+        try:
+            window_center = self.get_value(_CoreTags.WindowCenter, get_first=True)
+        except KeyError:
+            window_center = None
+        try:
+            window_width = self.get_value(_CoreTags.WindowWidth, get_first=True)
+        except KeyError:
+            window_width = None
+        return window_center, window_width
+
     @property
     def vmax(self) -> float | None:
         """Returns the default maximum value for the viewing LUT (i.e. white on a grey scale image).
         Calculated from the the window center and width tags.
         This is **not** normally the maximum value in the image,
         however if the relevant tags are not available then this is the fallback."""
-        try:
-            window_width = self.get_value(_CoreTags.WindowWidth, get_first=True)
-            window_center = self.get_value(_CoreTags.WindowCenter, get_first=True)
-            if window_center is not None and window_width is not None:
-                vmax = window_center + (window_width / 2)
-            else:
-                raise TypeError("Could not get window width or window center.")
-        except TypeError:
-            vmax = super().vmax
-        except KeyError:
-            vmax = super().vmax
-        return vmax
+        window_center, window_width = self._window_center_width()
+        # multi-valued or missing tags fall back to the image values
+        if (not isinstance(window_center, (int, float))
+                or not isinstance(window_width, (int, float))):
+            return super().vmax
+        return window_center + (window_width / 2)
 
     @property
     def vmin(self) -> float | None:
@@ -1214,48 +1428,36 @@ class Instance(FileImageSet):
         Calculated from the the window center and width tags.
         This is **not** normally the minimum value in the image,
         however if the relevant tags are not available then this is the fallback."""
-        try:
-            window_width = self.get_value(_CoreTags.WindowWidth, get_first=True)
-            window_center = self.get_value(_CoreTags.WindowCenter, get_first=True)
-            if window_center is not None and window_width is not None:
-                vmin = window_center - (window_width / 2)
-            else:
-                raise TypeError("Could not get window width or window center.")
-        except TypeError:
-            vmin = super().vmin
-        except KeyError:
-            vmin = super().vmin
-        return vmin
+        window_center, window_width = self._window_center_width()
+        # multi-valued or missing tags fall back to the image values
+        if (not isinstance(window_center, (int, float))
+                or not isinstance(window_width, (int, float))):
+            return super().vmin
+        return window_center - (window_width / 2)
 
     @property
     def window(self) -> float | None:
         """Returns the default window width from the window width tag.
         If this is not available then it is calculated from the array min and max values."""
         try:
-            window = self.get_value(_CoreTags.WindowWidth, get_first=True)
-            if window is not None:
-                return window
-            else:
-                return super().window
-        except KeyError:
-            return super().window
+            _, window = self._window_center_width()
         except IndexError:
             return super().window
+        if window is not None:
+            return window
+        return super().window
 
     @property
     def level(self) -> float | None:
         """Returns the default level (window centre) from the window center tag.
         If this is not available then it is calculated from the array min and max values."""
         try:
-            level = self.get_value(_CoreTags.WindowCenter, get_first=True)
-            if level is not None:
-                return level
-            else:
-                return super().level
-        except KeyError:
-            return super().level
+            level, _ = self._window_center_width()
         except IndexError:
             return super().level
+        if level is not None:
+            return level
+        return super().level
 
     @property
     def pixel_spacing(self) -> tuple[float, float] | None:
@@ -1268,16 +1470,11 @@ class Instance(FileImageSet):
         except KeyError:
             return None
 
-        if pixel_spacing is None:
+        # a missing or single value cannot give both spacings
+        if not isinstance(pixel_spacing, (MultiValue, list, tuple)) or len(pixel_spacing) < 2:
             return None
 
-        try:
-            row_spacing = pixel_spacing[0]
-            column_spacing = pixel_spacing[1]
-        except TypeError:
-            return None
-
-        return (row_spacing, column_spacing)
+        return (pixel_spacing[0], pixel_spacing[1])
 
     @property
     def slice_thickness(self) -> float | None:
@@ -1285,15 +1482,10 @@ class Instance(FileImageSet):
         Returns None if this cannot be found using the SliceThickness tag.
         """
         try:
-            slice_thickness = self.get_value(_CoreTags.SliceThickness, get_first=True)
+            return self.get_value(_CoreTags.SliceThickness, get_first=True)
         except KeyError:
             return None
 
-        if slice_thickness is None:
-            return None
-
-        return slice_thickness
-
     @property
     def dicom_dataset(self) -> pydicom.Dataset | None:
         """Returns the pydicom dataset of the instance."""
@@ -1312,6 +1504,7 @@ class Instance(FileImageSet):
     def get_tag(self, tag: Tag, get_first: bool = False) -> pydicom.DataElement | list[pydicom.DataElement]:
         """
         Gets the DICOM tag for the instance.
+        Lookups are cached as the dataset of an instance does not change.
 
         Parameters
         ----------
@@ -1319,19 +1512,27 @@ class Instance(FileImageSet):
             The tag to get the value for.
 
         """
-        if self.is_frame:
-            dataset = self.series.dicom_dataset
-            if dataset is not None:
-                value = get_tag(dataset, tag, self.slice_number, get_first)
-            else:
-                raise AttributeError("Series has no dicom_dataset loaded.")
-        else:
-            dataset = self.dicom_dataset
-            if dataset is not None:
-                value = get_tag(dataset, tag, get_first=get_first)
+        cache_key = (int(tag), get_first)
+        if cache_key not in self._tag_cache:
+            if self.is_frame:
+                dataset = self.series.dicom_dataset
+                if dataset is None:
+                    raise AttributeError("Series has no dicom_dataset loaded.")
+                frame = self.slice_number
             else:
-                raise AttributeError("Instance has no dicom_dataset loaded.")
+                dataset = self.dicom_dataset
+                if dataset is None:
+                    raise AttributeError("Instance has no dicom_dataset loaded.")
+                frame = None
+
+            try:
+                self._tag_cache[cache_key] = get_tag(dataset, tag, frame, get_first)
+            except KeyError:
+                self._tag_cache[cache_key] = None
 
+        value = self._tag_cache[cache_key]
+        if value is None:
+            raise KeyError(f"{tag}, {tag.name}")
         return value
 
     @overload
@@ -1351,17 +1552,7 @@ class Instance(FileImageSet):
         get_first : bool, optional
             Whether to get the first value for a matching tag
         """
-        if self.is_frame:
-            dataset = self.series.dicom_dataset
-            if dataset is not None:
-                value = get_value(dataset, tag, self.slice_number, get_first)
-            else:
-                raise AttributeError("Series has no dicom_dataset loaded.")
-        else:
-            dataset = self.dicom_dataset
-            if dataset is not None:
-                value = get_value(dataset, tag, get_first=get_first)
-            else:
-                raise AttributeError("Instance has no dicom_dataset loaded.")
-
-        return value
+        tag_object = self.get_tag(tag, get_first)
+        if isinstance(tag_object, list):
+            return [t.value for t in tag_object]
+        return tag_object.value
@@ -5,6 +5,7 @@ import dataclasses as dc
 from dataclasses import dataclass
 from typing import overload, Literal, Any
 import pydicom
+from pydicom.tag import BaseTag
 
 
 @dataclass()
@@ -37,6 +38,8 @@ class Tag:
     alternative_tags : list[tuple[int, int]]
     as_tuple : tuple[int, int]
         This tag as a tuple of (group, element).
+    pydicom_tag : BaseTag
+        This tag as a pydicom BaseTag, used as the key for Dataset lookups.
 
     Methods
     -------
@@ -49,6 +52,11 @@ class Tag:
     element: int
     links: list['TagLink'] = dc.field(default_factory=list)
     alternative_tags: list[tuple[int, int]] = dc.field(default_factory=list)
+    pydicom_tag: BaseTag = dc.field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # a BaseTag key skips pydicom converting the key on every Dataset lookup
+        self.pydicom_tag = BaseTag(int(self))
 
     @property
     def as_tuple(self) -> tuple[int, int]:
@@ -146,9 +154,9 @@ def get_tag(dicom_image: pydicom.Dataset | pydicom.DataElement,
 
     try:
         if get_first:
-            return dicom_image[int(tag)]
+            return dicom_image[tag.pydicom_tag]
         else:
-            return [dicom_image[int(tag)]]
+            return [dicom_image[tag.pydicom_tag]]
     except KeyError:
         pass
 
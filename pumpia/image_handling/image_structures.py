@@ -9,10 +9,8 @@ Classes:
 from abc import ABC, abstractmethod
 from collections.abc import Callable
 from pathlib import Path
-from copy import copy
 from typing import TYPE_CHECKING, Literal, overload
 import numpy as np
-import matplotlib.pyplot as plt
 
 if TYPE_CHECKING:
     from pumpia.image_handling.roi_structures import BaseROI
@@ -31,6 +29,8 @@ class BaseImageSet(ABC):
     menu_options : list[tuple[str, Callable[[], None]]]
     """
 
+    __slots__ = ()
+
     def __hash__(self) -> int:
         return hash(self.id_string)
 
@@ -125,6 +125,9 @@ class ArrayImage(BaseImageSet):
         Resets the image properties to their default values.
     """
 
+    __slots__ = ("shape", "num_samples", "mode", "_current_slice", "_rois",
+                 "x", "y", "zoom", "rotation", "_user_window", "_user_level")
+
     def __init__(self,
                  shape: tuple[int, int, int, int] | tuple[int, int, int] | tuple[int, int],
                  num_samples: int = 1,
@@ -513,6 +516,10 @@ class ArrayImage(BaseImageSet):
         """
         Plots the z profile of the image in a new window.
         """
+        # pyplot is slow to import, so it is only imported when plotting
+        # pylint: disable-next=import-outside-toplevel
+        import matplotlib.pyplot as plt
+
         plt.clf()
         plt.plot(self.z_profile, ".-")
         try:
@@ -553,6 +560,8 @@ class FileImageSet(ArrayImage):
         The file path of the image.
     """
 
+    __slots__ = ("_filepath",)
+
     def __init__(self,
                  shape: tuple[int, int, int, int] | tuple[int, int, int] | tuple[int, int],
                  filepath: Path,
@@ -560,7 +569,7 @@ class FileImageSet(ArrayImage):
                  mode: str | None = None
                  ) -> None:
         super().__init__(shape, num_samples, mode)
-        self._filepath: Path = copy(filepath)
+        self._filepath: Path = filepath
 
     def __str__(self) -> str:
         return str(self.filepath)
@@ -608,6 +617,8 @@ class ImageCollection(ArrayImage):
         Adds an image to the collection.
     """
 
+    __slots__ = ("_image_set",)
+
     def __init__(self,
                  shape: tuple[int, int, int, int] | tuple[int, int, int] | tuple[int, int],
                  num_samples: int = 1,
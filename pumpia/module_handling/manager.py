@@ -4,6 +4,7 @@ Classes:
 """
 import gc
 import datetime
+from concurrent.futures import ThreadPoolExecutor
 import typing
 from typing import TYPE_CHECKING, Literal
 from collections.abc import Callable, Sequence
@@ -16,6 +17,7 @@ import PIL
 from PIL import Image
 from pydicom import dcmread, FileDataset
 from pydicom.errors import InvalidDicomError
+from pydicom.pixels.decoders.base import get_decoder
 
 from pumpia.file_handling.dicom_structures import Patient, Study, Series, Instance
 from pumpia.file_handling.general_structures import GeneralImage
@@ -61,6 +63,57 @@ MouseOptions: tuple[MouseOptionsType] = typing.get_args(MouseOptionsType)
 ReducedMouseOptions: tuple[ReducedMouseOptionsType] = typing.get_args(ReducedMouseOptionsType)
 ROIOptions: tuple[ROIOptionsType] = typing.get_args(ROIOptionsType)
 
+MAX_READ_WORKERS: int = 16
+_PIXEL_DATA_KEYWORDS = ("PixelData", "FloatPixelData", "DoubleFloatPixelData")
+
+
+def _read_file(filepath: Path) -> FileDataset | Image.Image | None:
+    """
+    Reads a file as either a DICOM dataset or a PIL image.
+    Large DICOM elements, such as the pixel data, are deferred until they are accessed,
+    so rather than decoding the pixel data the DICOM is only accepted
+    if a pixel data decoder is available for its transfer syntax.
+
+    Parameters
+    ----------
+    filepath : Path
+        The file to read.
+
+    Returns
+    -------
+    FileDataset | Image.Image | None
+        The DICOM dataset if the file is a DICOM with pixel data that can be decoded,
+        the PIL image if the file is an image,
+        otherwise None.
+
+    Raises
+    ------
+    RuntimeError
+        If the file is a DICOM whose pixel data cannot be decoded.
+    """
+    try:
+        open_dicom = dcmread(filepath, defer_size="1 KB")
+    except InvalidDicomError:
+        try:
+            return Image.open(filepath)
+        except PIL.UnidentifiedImageError:
+            return None
+    if not any(keyword in open_dicom for keyword in _PIXEL_DATA_KEYWORDS):
+        return None
+    try:
+        transfer_syntax = open_dicom.file_meta.TransferSyntaxUID
+    except AttributeError:
+        return None
+    try:
+        decoder = get_decoder(transfer_syntax)
+    except NotImplementedError as exc:
+        raise RuntimeError(
+            f"no pixel data decoder exists for transfer syntax {transfer_syntax.name}") from exc
+    if not decoder.is_available:
+        raise RuntimeError(
+            f"no plugins are available to decode transfer syntax {transfer_syntax.name}")
+    return open_dicom
+
 
 class Manager:
     """
@@ -256,22 +309,7 @@ class Manager:
             gc.collect()
 
         try:
-            try:
-                open_dicom = dcmread(filepath)
-            except InvalidDicomError:
-                try:
-                    image = Image.open(filepath)
-                except PIL.UnidentifiedImageError:
-                    pass
-                else:
-                    self.general_images.add(GeneralImage(image, filepath))
-            else:
-                try:
-                    _ = open_dicom.pixel_array
-                except AttributeError:
-                    pass
-                else:
-                    self.load_dicom(open_dicom, filepath)
+            self._add_read_file(_read_file(filepath), filepath)
         # pylint: disable-next=broad-exception-caught
         except Exception:
             logger.warning("%s failed to load.", filepath, exc_info=True)
@@ -336,38 +374,36 @@ class Manager:
 
             tk_parent.update()
 
-        for file in files:
-            try:
+        # files are read in parallel as this is I/O bound,
+        # the structures are then built in order on this thread.
+        with ThreadPoolExecutor(max_workers=MAX_READ_WORKERS) as executor:
+            futures = [executor.submit(_read_file, file) for file in files]
+            for file, future in zip(files, futures):
                 try:
-                    open_dicom = dcmread(file)
-                except InvalidDicomError:
-                    try:
-                        image = Image.open(file)
-                    except PIL.UnidentifiedImageError:
-                        pass
-                    else:
-                        self.general_images.add(GeneralImage(image, file))
-                else:
-                    try:
-                        _ = open_dicom.pixel_array
-                    except AttributeError:
-                        pass
-                    else:
-                        self.load_dicom(open_dicom, file)
-            # pylint: disable-next=broad-exception-caught
-            except Exception:
-                logger.warning("%s failed to load.", file, exc_info=True)
-
-            if tk_parent is not None:
-                file_count += 1
-                count_label["text"] = f"{file_count}/{total_files}"
-                count_bar.step(1)
-                tk_parent.update()
+                    self._add_read_file(future.result(), file)
+                # pylint: disable-next=broad-exception-caught
+                except Exception:
+                    logger.warning("%s failed to load.", file, exc_info=True)
+
+                if tk_parent is not None:
+                    file_count += 1
+                    count_label["text"] = f"{file_count}/{total_files}"
+                    count_bar.step(1)
+                    tk_parent.update()
 
         if tk_parent is not None:
             count_frame.destroy()
         self.update_trees()
 
+    def _add_read_file(self, read_file: FileDataset | Image.Image | None, filepath: Path) -> None:
+        """
+        Adds the output of `_read_file` to the loaded images.
+        """
+        if isinstance(read_file, Image.Image):
+            self.general_images.add(GeneralImage(read_file, filepath))
+        elif read_file is not None:
+            self.load_dicom(read_file, filepath)
+
     def load_dicom(self, open_dicom: FileDataset, file: Path) -> Series | Instance:
         """
         Loads a DICOM file.
@@ -399,11 +435,8 @@ class Manager:
         # load study
         study_id = get_value(open_dicom, _CoreTags.StudyInstanceUID, get_first=True)
         study_id_str = patient.id_string + " : " + study_id
-        if study_id_str in patient.studies:
-            for sd in patient.studies:
-                if sd == study_id_str:
-                    study = sd
-        else:
+        study = patient.get_study(study_id_str)
+        if study is None:
             study_date = get_value(open_dicom, _CoreTags.StudyDate, get_first=True)
             study_time = get_value(open_dicom, _CoreTags.StudyTime, get_first=True)
 
@@ -464,11 +497,8 @@ class Manager:
         else:
             series_id_str = study.id_string + " : " + series_id + "-" + str(acquisition_number)
 
-        if series_id_str in study.series:
-            for sr in study.series:
-                if sr == series_id_str:
-                    series = sr
-        else:
+        series = study.get_series(series_id_str)
+        if series is None:
             if is_enhanced:
                 series = Series(study=study,
                                 series_id=series_id,
@@ -504,7 +534,7 @@ class Manager:
                 else:
                     instance_id_str = series.id_string + " : " + str(dimension_index_values)
 
-                if not instance_id_str in series.instances:
+                if series.get_instance(instance_id_str) is None:
                     instance = Instance(series=series,
                                         slice_number=frame_number,
                                         filepath=file,
@@ -519,11 +549,8 @@ class Manager:
 
         else:
             instance_id_str = series.id_string + " : " + str(instance_number)
-            if instance_id_str in series.instances:
-                for ins in series.instances:
-                    if ins == instance_id_str:
-                        instance = ins
-            else:
+            instance = series.get_instance(instance_id_str)
+            if instance is None:
                 instance = Instance(series=series,
                                     slice_number=instance_number,
                                     filepath=file,
@@ -30,9 +30,10 @@ def show_dicom_tags(dicom: pydicom.Dataset | Series | Instance):
     """
     title = "DICOM Tags"
     if isinstance(dicom, (Series, Instance)):
-        if dicom.dicom_dataset is not None:
+        dataset = dicom.dicom_dataset
+        if dataset is not None:
             title = title + ": " + dicom.full_string
-            dicom = dicom.dicom_dataset
+            dicom = dataset
         else:
             return
 
@@ -104,8 +105,9 @@ def compare_dicom_tags(*dicoms: pydicom.Dataset | Series | Instance):
         columns.append(f"Value{i}")
         diff_checks.append(True)
         if isinstance(dicom, (Series, Instance)):
-            if dicom.dicom_dataset is not None:
-                dicom_datasets.append(dicom.dicom_dataset)
+            dataset = dicom.dicom_dataset
+            if dataset is not None:
+                dicom_datasets.append(dataset)
             else:
                 return
         else:
@@ -1,12 +1,33 @@
+#!/usr/bin/env python3
+# Only uses the standard library, so it can also be run with PyPy: pypy3 dicom_miner.py
 import xml.etree.ElementTree as ET
 import dataclasses as dc
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
 import re
-import itertools
 
-
-@dataclass
+LINE_BREAK_RE = re.compile("\n|\u200b")
+MULTI_SPACE_RE = re.compile(" {2,}")
+
+# one bit per modality so a tag's modalities are a single int
+XRAY = 1 << 0
+CT = 1 << 1
+NUC_MED = 1 << 2
+US = 1 << 3
+MRI = 1 << 4
+CORE = 1 << 5
+MODALITY_BITS = {"XRAY": XRAY,
+                 "CT": CT,
+                 "Nuclear Medicine": NUC_MED,
+                 "Ultrasound": US,
+                 "MRI": MRI,
+                 "CORE": CORE}
+
+
+@dataclass(slots=True)
 class Tag:
     name: str
     keyword: str
@@ -14,7 +35,7 @@ class Tag:
     element: int
     parents: dict[tuple[int, int], bool] = dc.field(default_factory=dict)
     alternative_tags: list[tuple[int, int]] = dc.field(default_factory=list)
-    modalities: set[str] = dc.field(default_factory=set)
+    modalities: int = 0
     written: bool = False
     modalities_set: bool = False
 
@@ -38,7 +59,6 @@ class Tag:
             is_frame_link_list = True
 
         if isinstance(parents, list):
-            # pylint: disable-next=redefined-outer-name
             for i, t in enumerate(parents):
                 if t != self.as_tuple:
                     if is_frame_link_list:
@@ -48,23 +68,14 @@ class Tag:
         elif parents != self.as_tuple:
             self.parents[parents] = frame_link  # type: ignore
 
-    # pylint: disable-next=redefined-outer-name
     def add_modality(self, modality: str):
-        self.modalities.add(modality)
-
-    def set_parent_modalities(self, tags: dict[tuple[int, int], 'Tag'], chain: list['Tag']):
-        if self not in chain:
-            chain.append(self)
-            for p, _ in self.parents.items():
-                for m in self.modalities:
-                    tags[p].modalities.add(m)
-                tags[p].set_parent_modalities(tags, chain)
+        self.modalities |= MODALITY_BITS[modality]
 
     def __str__(self) -> str:
         return f"({self.group:04X}, {self.element:04X})"
 
 
-@dataclass
+@dataclass(slots=True)
 class Table:
     rows: list['Tag | Table'] = dc.field(default_factory=list)
     sub_rows: list['Tag | Table'] = dc.field(default_factory=list)
@@ -75,7 +86,6 @@ class Table:
         for row in self.rows:
             row.add_parents(parents, frame_link)
 
-    # pylint: disable-next=redefined-outer-name
     def add_modality(self, modality: str):
         for row in self.rows:
             row.add_modality(modality)
@@ -83,67 +93,168 @@ class Table:
             row.add_modality(modality)
 
 
-def str_to_tags(tag_str: str) -> list[tuple[int, int]]:
+def expand_hex(hex_str: str, even_last: bool = False) -> list[int]:
+    # fixed nibbles are set once, each "x" nibble is then filled from a counter with bit shifts
+    fixed = 0
+    wildcards: list[tuple[int, int]] = []  # (shift, bits) for each "x", least significant first
+    for i, char in enumerate(reversed(hex_str)):
+        if char == "x":
+            wildcards.append((4 * i, 4))
+        else:
+            fixed |= int(char, 16) << (4 * i)
+
+    if even_last and hex_str[-1] == "x":
+        wildcards[0] = (1, 3)  # only even values in the last nibble
+
+    num_bits = sum(bits for _, bits in wildcards)
+    lowest = wildcards[0][0] if wildcards else 0
+    if all(shift == lowest + sum(bits for _, bits in wildcards[:i])
+           for i, (shift, _) in enumerate(wildcards)):
+        # a single run of wildcard bits is just an arithmetic progression
+        return list(range(fixed, fixed + (1 << (lowest + num_bits)), 1 << lowest))
+
+    values: list[int] = []
+    for combo in range(1 << num_bits):
+        value = fixed
+        for shift, bits in wildcards:
+            value |= (combo & ((1 << bits) - 1)) << shift
+            combo >>= bits
+        values.append(value)
+
+    return values
+
+
+# the same tag strings appear in many tables, a tuple is returned so cached results can't be changed
+@lru_cache(maxsize=None)
+def str_to_tags(tag_str: str) -> tuple[tuple[int, int], ...]:
     tag_str = tag_str.strip()
     tag_str = tag_str.strip("()")
     tag_str_list = tag_str.split(",")
-    group_str = tag_str_list[0]
-    element_str = tag_str_list[1]
+    groups = expand_hex(tag_str_list[0], even_last=True)
+    elements = expand_hex(tag_str_list[1])
 
-    groups: list[int] = []
-    elements: list[int] = []
+    return tuple((group, element) for group in groups for element in elements)
 
-    full_hex = ["0", "1", "2", "3", "4", "5", "6", "7", "8", "9", "A", "B", "C", "D", "E", "F"]
-    even_hex = ["0", "2", "4", "6", "8", "A", "C", "E"]
 
-    if "x" in group_str:
-        num_x = group_str.count("x")
-        if group_str[-1] == "x":
-            num_x -= 1
-            if num_x == 0:
-                replacements = itertools.product(even_hex)
-            else:
-                replacements = itertools.product(*[full_hex for _ in range(num_x)],
-                                                 even_hex)
-        else:
-            replacements = itertools.product(*[full_hex for _ in range(num_x)])
-        for values in replacements:
-            new_group_str = group_str
-            for value in values:
-                new_group_str = new_group_str.replace("x", value, 1)
-            groups.append(int("0x" + new_group_str, 0))
-    else:
-        groups.append(int("0x" + group_str, 0))
-
-    if "x" in element_str:
-        num_x = element_str.count("x")
-        replacements = itertools.product(*[full_hex for _ in range(num_x)])
-        for values in replacements:
-            new_element_str = element_str
-            for value in values:
-                new_element_str = new_element_str.replace("x", value, 1)
-            elements.append(int("0x" + new_element_str, 0))
-    else:
-        elements.append(int("0x" + element_str, 0))
-
-    return [tag for tag in itertools.product(groups, elements)]
-
-
-# pylint: disable-next=redefined-outer-name
-def section_tables(root: ET.Element, section_name: str) -> list[str]:
-    # pylint: disable-next=redefined-outer-name
-    tables: list[str] = []
-    for section in root.iter(f'{{{namespace}}}section'):
-        # pylint: disable-next=redefined-outer-name
-        label = section.get("label")
-        if label == section_name:
-            # pylint: disable-next=redefined-outer-name
-            for table in section.iter(f'{{{namespace}}}table'):
-                tab_lab = table.get("label")
-                if tab_lab is not None:
-                    tables.append(tab_lab)
-
-    return tables
+def set_parent_modalities(tags: dict[tuple[int, int], Tag]):
+    # worklist until no parent gains a modality, so cycles in the parent links terminate
+    worklist = list(tags.values())
+    while worklist:
+        tag = worklist.pop()
+        for p in tag.parents:
+            parent = tags[p]
+            if tag.modalities & ~parent.modalities:
+                parent.modalities |= tag.modalities
+                worklist.append(parent)
+
+
+@dataclass(frozen=True, slots=True)
+class XmlTags:
+    # Clark notation names of the DocBook elements used, built once per file
+    table: str
+    section: str
+    thead: str
+    tbody: str
+    th: str
+    tr: str
+    td: str
+    xref: str
+
+    @classmethod
+    def from_namespace(cls, namespace: str) -> 'XmlTags':
+        return cls(*(f"{{{namespace}}}{name}"
+                     for name in ("table", "section", "thead", "tbody", "th", "tr", "td", "xref")))
+
+
+@dataclass(slots=True)
+class TableRow:
+    vals: list[str]
+    link: str | None = None  # linkend of the first xref in the row
+
+
+@dataclass(slots=True)
+class TableInfo:
+    label: str | None
+    column_titles: list[str]
+    rows: list[TableRow] = dc.field(default_factory=list)
+
+
+@dataclass(slots=True)
+class SectionInfo:
+    label: str | None
+    tables: list[str] = dc.field(default_factory=list)
+
+
+def cell_text(cell: ET.Element) -> str:
+    text = "".join(cell.itertext())
+    return MULTI_SPACE_RE.sub(" ", LINE_BREAK_RE.sub(" ", text).strip())
+
+
+def read_table(table: ET.Element, xml_tags: XmlTags) -> TableInfo:
+    head = table.find(xml_tags.thead)
+    column_titles = []
+    if head is not None:
+        for th in head.iter(xml_tags.th):
+            column_titles.append(cell_text(th))
+
+    table_info = TableInfo(table.get("label"), column_titles)
+    body = table.find(xml_tags.tbody)
+    if body is not None:
+        for tr in body.iter(xml_tags.tr):
+            vals = [cell_text(td) for td in tr.iter(xml_tags.td)]
+            ref = next(tr.iter(xml_tags.xref), None)
+            link = ref.get("linkend") if ref is not None else None
+            table_info.rows.append(TableRow(vals, link))
+
+    return table_info
+
+
+def part03_table_ignored(label: str | None) -> bool:
+    # unlabelled tables and section 5 (conventions) are not used from part 3
+    return label is None or label[:2] == "5."
+
+
+def read_xml_tables(xml_path: Path,
+                    ignore_table: Callable[[str | None], bool] | None = None
+                    ) -> tuple[list[TableInfo], list[SectionInfo]]:
+    # stream the file, clearing each table and section once read so the whole tree is never held
+    # tables for which ignore_table(label) is True are only recorded in their sections, not read
+    tables: list[TableInfo] = []
+    sections: list[SectionInfo] = []
+    open_sections: list[SectionInfo] = []
+    xml_tags: XmlTags | None = None
+    for event, elem in ET.iterparse(xml_path, events=("start", "end")):
+        if xml_tags is None:
+            xml_tags = XmlTags.from_namespace(elem.tag[1:].split("}")[0])
+
+        if event == "start":
+            if elem.tag == xml_tags.section:
+                section = SectionInfo(elem.get("label"))
+                sections.append(section)
+                open_sections.append(section)
+        elif elem.tag == xml_tags.table:
+            label = elem.get("label")
+            if label is not None:
+                for section in open_sections:
+                    section.tables.append(label)
+            if ignore_table is None or not ignore_table(label):
+                tables.append(read_table(elem, xml_tags))
+            elem.clear()
+        elif elem.tag == xml_tags.section:
+            open_sections.pop()
+            elem.clear()
+
+    return tables, sections
+
+
+def index_section_tables(sections: list[SectionInfo]) -> dict[str, list[str]]:
+    # section label -> labels of the tables within it, so references are a dict lookup
+    section_tables: dict[str, list[str]] = {}
+    for section in sections:
+        if section.label is not None:
+            section_tables.setdefault(section.label, []).extend(section.tables)
+
+    return section_tables
 
 
 CORE_TAGS = [(0x0008, 0x0020),
@@ -167,50 +278,84 @@ CORE_TAGS = [(0x0008, 0x0020),
              (0x0028, 0x1051),
              (0x0028, 0x1052),
              (0x0028, 0x1053)]
-############################################
-# STEP 1
 
+TAG_COLUMNS = ["Tag", "Name", "Keyword", "VR", "VM", ""]  # for tables which define tags
+
+MODULE_COLUMNS = ["Attribute Name", "Tag", "Type", "Attribute Description"]
+ALT_MODULE_COLUMNS = ["Attribute Name", "Tag", "Type", "Description"]
+
+IOD_COLUMNS = ["IE", "Module", "Reference", "Usage"]
+FUNC_GROUP_COLUMNS = ["Functional Group Macro", "Section", "Usage"]
+
+MODALITY_TABLES = {
+    "A.2-1": "XRAY",
+    "A.14-1": "XRAY",
+    "A.16-1": "XRAY",
+    "A.26-1": "XRAY",
+    "A.27-1": "XRAY",
+    "A.28-1": "XRAY",
+    "A.47-1": "XRAY",
+    "A.47-2": "XRAY",
+    "A.48-1": "XRAY",
+    "A.48-2": "XRAY",
+
+
+    "A.3-1": "CT",
+    "A.38-1": "CT",
+    "A.38-2": "CT",
 
-tags_xml = Path(__file__).parent / "part06.xml"
 
-tree = ET.parse(tags_xml)
-root = tree.getroot()
-namespace = root.tag[1:].split("}")[0]
-COLUMNS = ["Tag", "Name", "Keyword", "VR", "VM", ""]  # for tables which define tags
+    "A.5-1": "Nuclear Medicine",
+    "A.21.3-1": "Nuclear Medicine",
+    "A.56-1": "Nuclear Medicine",
+    "A.56-2": "Nuclear Medicine",
 
-tags: dict[tuple[int, int], Tag] = {}
 
-for table in root.iter(f'{{{namespace}}}table'):
-    head = table.find(f"{{{namespace}}}thead")
-    column_titles = []
-    if head is not None:
-        for th in head.iter(f"{{{namespace}}}th"):
-            text = ""
-            for elem in th.findall(".//*"):
-                if elem.text is not None:
-                    try:
-                        text = text + elem.text
-                    except (AttributeError, TypeError):
-                        pass
-            text = re.sub(' {2,}', ' ', re.sub("\n|\u200b", " ", text).strip())
-            column_titles.append(text)
-
-    if column_titles == COLUMNS:
-        body = table.find(f"{{{namespace}}}tbody")
-        if body is not None:
-            for tr in body.iter(f"{{{namespace}}}tr"):
-                vals = []
-                column = 0
-                for td in tr.iter(f"{{{namespace}}}td"):
-                    text = ""
-                    for elem in td.findall(".//*"):
-                        if elem.text is not None:
-                            try:
-                                text = text + elem.text
-                            except (AttributeError, TypeError):
-                                pass
-                    text = re.sub(' {2,}', ' ', re.sub("\n|\u200b", " ", text).strip())
-                    vals.append(text)
+    "A.6-1": "Ultrasound",
+    "A.7-1": "Ultrasound",
+    "A.59-1": "Ultrasound",
+    "A.59-2": "Ultrasound",
+
+
+    "A.4-1": "MRI",
+    "A.36-1": "MRI",
+    "A.36-2": "MRI",
+    "A.36-3": "MRI",
+    "A.36-4": "MRI",
+    "A.36-5": "MRI", }
+
+# (modality bit, file name, module description) for the files holding a subset of the tags
+MODALITY_FILES = [(XRAY, "XRAYTags.py", "X-ray DICOM Tags"),
+                  (CT, "CTTags.py", "CT DICOM Tags"),
+                  (NUC_MED, "NucMedTags.py", "Nuclear Medicine DICOM Tags"),
+                  (US, "USTags.py", "Ultrasound DICOM Tags"),
+                  (MRI, "MRTags.py", "MRI DICOM Tags"),
+                  (CORE, "_CoreTags.py", "Core Tags")]
+
+INIT_TEXT = "from pumpia.file_handling.dicom_tags import Tag, TagLink\n\n"
+TAG_LINE = '{keyword} = Tag({name!a}, "{keyword}", 0x{group:04X}, 0x{element:04X}{parents}{alternative_tags})\n'
+
+
+def main():
+    # the two parts of the standard are independent so they are read in parallel
+    xml_folder = Path(__file__).parent
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        part06_future = executor.submit(read_xml_tables, xml_folder / "part06.xml")
+        part03_future = executor.submit(read_xml_tables,
+                                        xml_folder / "part03.xml",
+                                        part03_table_ignored)
+        part06_tables, _ = part06_future.result()
+        part03_tables, part03_sections = part03_future.result()
+
+    ############################################
+    # STEP 1
+
+    tags: dict[tuple[int, int], Tag] = {}
+
+    for table_info in part06_tables:
+        if table_info.column_titles == TAG_COLUMNS:
+            for row in table_info.rows:
+                vals = row.vals
                 tag = str_to_tags(vals[0])
                 desc = vals[2].replace(" ", "")
                 first = 0
@@ -221,86 +366,56 @@ for table in root.iter(f'{{{namespace}}}table'):
                 except IndexError:
                     first -= 1
                 init_tag = tag[first]
-                alt_tag = tag[first + 1:]
+                alt_tag = list(tag[first + 1:])
                 tags[init_tag] = Tag(vals[1], desc, init_tag[0], init_tag[1], alternative_tags=alt_tag)
                 if init_tag in CORE_TAGS:
                     tags[init_tag].add_modality("CORE")
 
-###################################################
-# STEP 2
-
-tags_xml = Path(__file__).parent / "part03.xml"
-tree = ET.parse(tags_xml)
-root = tree.getroot()
-namespace = root.tag[1:].split("}")[0]
-
-COLUMNS = ["Attribute Name", "Tag", "Type", "Attribute Description"]
-ALT_COLUMNS = ["Attribute Name", "Tag", "Type", "Description"]
-
-tables: dict[str, Table] = {}
-
-for table in root.iter(f'{{{namespace}}}table'):
-    label = table.get("label")
-
-    if label is not None and label[:2] != "5.":
-        head = table.find(f"{{{namespace}}}thead")
-        if head is not None:
-            column_titles = []
-            for th in head.iter(f"{{{namespace}}}th"):
-                text = ""
-                for elem in th.findall(".//*"):
-                    if elem.text is not None:
-                        try:
-                            text = text + elem.text
-                        except (AttributeError, TypeError):
-                            pass
-                text = re.sub(' {2,}', ' ', re.sub("\n|\u200b", " ", text).strip())
-                column_titles.append(text)
-            if column_titles == COLUMNS or column_titles == ALT_COLUMNS:
-                tables[label] = Table()
-
-for table in root.iter(f'{{{namespace}}}table'):
-    label = table.get("label")
-    if label in tables:
-        body = table.find(f"{{{namespace}}}tbody")
-        if body is not None:
+    ###################################################
+    # STEP 2
+
+    section_tables = index_section_tables(part03_sections)
+    # lower case (name, keyword) of every tag, so rows are matched without re-normalising
+    normalised_names = {key: (tag.name.lower(), tag.keyword.lower()) for key, tag in tags.items()}
+
+    tables: dict[str, Table] = {}
+
+    for table_info in part03_tables:
+        label = table_info.label
+        if label is not None and table_info.column_titles in (MODULE_COLUMNS, ALT_MODULE_COLUMNS):
+            tables[label] = Table()
+
+    # part 3 is walked once: module tables are filled (step 2) while the IOD and
+    # functional group references are collected, these are applied in step 3
+    # once every module table has all of its rows
+    module_links: list[tuple[Table, str | None, bool]] = []  # (table, modality, is functional group)
+
+    for table_info in part03_tables:
+        label = table_info.label
+        column_titles = table_info.column_titles
+        if label in tables:
             levels: dict[int, Tag | Table] = {}
-            for tr in body.iter(f"{{{namespace}}}tr"):
-                vals = []
+            for row in table_info.rows:
+                vals = row.vals
                 current_row: Table | Tag | None = None
-                for td in tr.iter(f"{{{namespace}}}td"):
-                    text = ""
-                    for elem in td.findall(".//*"):
-                        if elem.text is not None:
-                            try:
-                                text = text + elem.text
-                            except (AttributeError, TypeError):
-                                pass
-                    text = re.sub(' {2,}', ' ', re.sub("\n|\u200b", " ", text).strip())
-                    vals.append(text)
                 stripped_name = vals[0].lstrip(">")
                 level = len(vals[0]) - len(stripped_name)
                 stripped_name = stripped_name.strip()
                 if "Include" in vals[0]:
-                    for ref in tr.iter(f"{{{namespace}}}xref"):
-                        tab_ref = ref.get("linkend")
-                        if tab_ref is not None and tab_ref[:6] == "table_":
-                            if tab_ref[6:] not in tables:
-                                print(tab_ref[6:])
-                            else:
-                                current_row = tables[tab_ref[6:]]
-                        break
+                    tab_ref = row.link
+                    if tab_ref is not None and tab_ref[:6] == "table_":
+                        if tab_ref[6:] not in tables:
+                            print(tab_ref[6:])
+                        else:
+                            current_row = tables[tab_ref[6:]]
                 elif len(vals) == 4:
                     tag = str_to_tags(vals[1])
-                    current_row = tags[tag[0]]
-                    try:
-                        c = 1
-                        while (current_row.name.lower() != stripped_name.lower()
-                               and current_row.keyword.lower() != stripped_name.replace(" ", "").lower()):
-                            current_row = tags[tag[c]]
-                            c += 1
-                    except IndexError:
-                        current_row = None
+                    name = stripped_name.lower()
+                    keyword = stripped_name.replace(" ", "").lower()
+                    # first tag matching the attribute name or keyword, None if there is no match
+                    current_row = next((tags[t] for t in tag
+                                        if normalised_names[t][0] == name
+                                        or normalised_names[t][1] == keyword), None)
                 if current_row is not None:
                     if level > 0:
                         seq = levels[level - 1]
@@ -320,200 +435,108 @@ for table in root.iter(f'{{{namespace}}}table'):
 
                     levels[level] = current_row
 
-##########################################
-# STEP 3
-
-IOD_COLUMNS = ["IE", "Module", "Reference", "Usage"]
-FUNC_GROUP_COLUMNS = ["Functional Group Macro", "Section", "Usage"]
-
-MODALITY_TABLES = {
-    "A.2-1": "XRAY",
-    "A.14-1": "XRAY",
-    "A.16-1": "XRAY",
-    "A.26-1": "XRAY",
-    "A.27-1": "XRAY",
-    "A.28-1": "XRAY",
-    "A.47-1": "XRAY",
-    "A.47-2": "XRAY",
-    "A.48-1": "XRAY",
-    "A.48-2": "XRAY",
-
-
-    "A.3-1": "CT",
-    "A.38-1": "CT",
-    "A.38-2": "CT",
-
-
-    "A.5-1": "Nuclear Medicine",
-    "A.21.3-1": "Nuclear Medicine",
-    "A.56-1": "Nuclear Medicine",
-    "A.56-2": "Nuclear Medicine",
-
-
-    "A.6-1": "Ultrasound",
-    "A.7-1": "Ultrasound",
-    "A.59-1": "Ultrasound",
-    "A.59-2": "Ultrasound",
-
-
-    "A.4-1": "MRI",
-    "A.36-1": "MRI",
-    "A.36-2": "MRI",
-    "A.36-3": "MRI",
-    "A.36-4": "MRI",
-    "A.36-5": "MRI", }
-
-for table in root.iter(f'{{{namespace}}}table'):
-    label = table.get("label")
-
-    if label is not None and label[:2] != "5.":
-        head = table.find(f"{{{namespace}}}thead")
-        if head is not None:
-            column_titles = []
-            for th in head.iter(f"{{{namespace}}}th"):
-                text = ""
-                for elem in th.findall(".//*"):
-                    if elem.text is not None:
-                        try:
-                            text = text + elem.text
-                        except (AttributeError, TypeError):
-                            pass
-                text = re.sub(' {2,}', ' ', re.sub("\n|\u200b", " ", text).strip())
-                column_titles.append(text)
-            if column_titles == IOD_COLUMNS and label in MODALITY_TABLES:
+        elif column_titles == IOD_COLUMNS and label in MODALITY_TABLES:
+            modality = MODALITY_TABLES[label]
+            for row in table_info.rows:
+                sect_ref = row.link
+                if sect_ref is not None and sect_ref[:5] == "sect_":
+                    for t in section_tables.get(sect_ref[5:], []):
+                        if t in tables:
+                            module_links.append((tables[t], modality, False))
+
+        elif column_titles == FUNC_GROUP_COLUMNS:
+            if label in MODALITY_TABLES:
                 modality = MODALITY_TABLES[label]
-                body = table.find(f"{{{namespace}}}tbody")
-                if body is not None:
-                    for tr in body.iter(f"{{{namespace}}}tr"):
-                        for ref in tr.iter(f"{{{namespace}}}xref"):
-                            sect_ref = ref.get("linkend")
-                            if sect_ref is not None and sect_ref[:5] == "sect_":
-                                sect_tables = section_tables(root, sect_ref[5:])
-                                for t in sect_tables:
-                                    if t in tables:
-                                        tables[t].add_modality(modality)
-                            break
-
-            elif column_titles == FUNC_GROUP_COLUMNS:
-                if label in MODALITY_TABLES:
-                    modality = MODALITY_TABLES[label]
-                else:
-                    modality = None
-                body = table.find(f"{{{namespace}}}tbody")
-                if body is not None:
-                    for tr in body.iter(f"{{{namespace}}}tr"):
-                        for ref in tr.iter(f"{{{namespace}}}xref"):
-                            sect_ref = ref.get("linkend")
-                            if sect_ref is not None and sect_ref[:5] == "sect_":
-                                sect_tables = section_tables(root, sect_ref[5:])
-                                for t in sect_tables:
-                                    if t in tables:
-                                        tables[t].add_parents((0x5200, 0x9230), True)
-                                        tables[t].add_parents((0x5200, 0x9229))
-                                        if modality is not None:
-                                            tables[t].add_modality(modality)
-                            break
-
-for _, t in tags.items():
-    t.set_parent_modalities(tags, [])
-
-##############################################
-# STEP 4
-
-
-current_folder = Path(__file__).resolve().parent / "dcm_tags"
-current_folder.mkdir(parents=True, exist_ok=True)
-
-git_file = open(current_folder / ".gitignore", "w+")
-git_file.write("*")
-git_file.close()
-
-dcm_file = open(current_folder / "DicomTags.py", "w+")
-xray_file = open(current_folder / "XRAYTags.py", "w+")
-ct_file = open(current_folder / "CTTags.py", "w+")
-nuc_med_file = open(current_folder / "NucMedTags.py", "w+")
-us_file = open(current_folder / "USTags.py", "w+")
-mri_file = open(current_folder / "MRTags.py", "w+")
-core_file = open(current_folder / "_CoreTags.py", "w+")
-
-init_text = "from pumpia.file_handling.dicom_tags import Tag, TagLink\n\n"
-
-dcm_file.write('"""Module containing all DICOM Tags."""\n\n')
-xray_file.write('"""Module containing X-ray DICOM Tags."""\n\n')
-ct_file.write('"""Module containing CT DICOM Tags."""\n\n')
-nuc_med_file.write('"""Module containing Nuclear Medicine DICOM Tags."""\n\n')
-us_file.write('"""Module containing Ultrasound DICOM Tags."""\n\n')
-mri_file.write('"""Module containing MRI DICOM Tags."""\n\n')
-core_file.write('"""Module containing Core Tags."""\n\n')
-
-dcm_file.write(init_text)
-xray_file.write(init_text)
-ct_file.write(init_text)
-nuc_med_file.write(init_text)
-us_file.write(init_text)
-mri_file.write(init_text)
-core_file.write(init_text)
-
-
-def write_to_files(tag: Tag, chain: list[Tag]):
-    if tag not in chain:
-        chain.append(tag)
-        for p in tag.parents:
-            write_to_files(tags[p], chain)
+            else:
+                modality = None
+            for row in table_info.rows:
+                sect_ref = row.link
+                if sect_ref is not None and sect_ref[:5] == "sect_":
+                    for t in section_tables.get(sect_ref[5:], []):
+                        if t in tables:
+                            module_links.append((tables[t], modality, True))
+
+    ##########################################
+    # STEP 3
+
+    for table, modality, functional_group in module_links:
+        if functional_group:
+            table.add_parents((0x5200, 0x9230), True)
+            table.add_parents((0x5200, 0x9229))
+        if modality is not None:
+            table.add_modality(modality)
+
+    set_parent_modalities(tags)
+
+    ##############################################
+    # STEP 4
+
+    current_folder = Path(__file__).resolve().parent / "dcm_tags"
+    current_folder.mkdir(parents=True, exist_ok=True)
+
+    (current_folder / ".gitignore").write_text("*")
+
+    # lines are collected per file and each file is written once at the end
+    dcm_lines: list[str] = []
+    modality_lines: dict[int, list[str]] = {bit: [] for bit, _, _ in MODALITY_FILES}
+
+    def write_to_files(tag: Tag, visited: set[tuple[int, int]]):
+        # iterative post-order walk so parents are always written before their children
+        if tag.as_tuple in visited:
+            return
+        visited.add(tag.as_tuple)
+        stack = [(tag, iter(tag.parents))]
+        while stack:
+            current, parents = stack[-1]
+            for p in parents:
+                if p not in visited:
+                    visited.add(p)
+                    stack.append((tags[p], iter(tags[p].parents)))
+                    break
+            else:
+                stack.pop()
+                write_tag(current)
 
+    def write_tag(tag: Tag):
         if not tag.written and tag.keyword != "":
-            name = ascii(tag.name)
-            keyword = tag.keyword
-            group = f"0x{tag.group:04X}"
-            element = f"0x{tag.element:04X}"
-
             if len(tag.parents) > 0:
-                parents = ", ["
-                for p, l in tag.parents.items():
-                    p_kw = tags[p].keyword
-                    if l:
-                        parents += f"TagLink({p_kw}, {l}),"
-                    else:
-                        parents += f"TagLink({p_kw}),"
-                parents += "]"
+                parents = ", [" + "".join(f"TagLink({tags[p].keyword}, {l}),"
+                                          if l else f"TagLink({tags[p].keyword}),"
+                                          for p, l in tag.parents.items()) + "]"
             else:
                 parents = ""
 
             if len(tag.alternative_tags) > 0:
-                alternative_tags = ", ["
-                for a in tag.alternative_tags:
-                    alternative_tags += f"(0x{a[0]:04X}, 0x{a[1]:04X}),"
-                alternative_tags += "]"
+                alternative_tags = ", [" + "".join(f"(0x{a[0]:04X}, 0x{a[1]:04X}),"
+                                                   for a in tag.alternative_tags) + "]"
                 if parents == "":
                     parents = ", []"
             else:
                 alternative_tags = ""
 
-            text = f'{keyword} = Tag({name}, "{keyword}", {group}, {element}{parents}{alternative_tags})\n'
-            dcm_file.write(text)
-            if 'XRAY' in tag.modalities:
-                xray_file.write(text)
-            if 'CT' in tag.modalities:
-                ct_file.write(text)
-            if 'Nuclear Medicine' in tag.modalities:
-                nuc_med_file.write(text)
-            if 'Ultrasound' in tag.modalities:
-                us_file.write(text)
-            if 'MRI' in tag.modalities:
-                mri_file.write(text)
-            if 'CORE' in tag.modalities:
-                core_file.write(text)
+            text = TAG_LINE.format(name=tag.name,
+                                   keyword=tag.keyword,
+                                   group=tag.group,
+                                   element=tag.element,
+                                   parents=parents,
+                                   alternative_tags=alternative_tags)
+            dcm_lines.append(text)
+            for bit, lines in modality_lines.items():
+                if tag.modalities & bit:
+                    lines.append(text)
 
             tag.written = True
 
+    visited_tags: set[tuple[int, int]] = set()
+    for _, t in tags.items():
+        write_to_files(t, visited_tags)
+
+    (current_folder / "DicomTags.py").write_text(
+        '"""Module containing all DICOM Tags."""\n\n' + INIT_TEXT + "".join(dcm_lines))
+    for bit, file_name, description in MODALITY_FILES:
+        (current_folder / file_name).write_text(
+            f'"""Module containing {description}."""\n\n' + INIT_TEXT + "".join(modality_lines[bit]))
 
-for _, t in tags.items():
-    write_to_files(t, [])
 
-dcm_file.close()
-xray_file.close()
-ct_file.close()
-nuc_med_file.close()
-us_file.close()
-mri_file.close()
-core_file.close()
+if __name__ == "__main__":
+    main()